@@ -1,13 +1,14 @@
 """Agent orchestrator for managing AI agent interactions and tool execution."""
 
 # stdlib
-import json
 from datetime import UTC, datetime
+from io import StringIO
 from os import getenv
 from pathlib import Path
 from uuid import uuid4 as uuid
 
 from dotenv import load_dotenv
+from pydantic_core import from_json
 
 from vindao_agents.AgentStores import AgentStore, JsonAgentStore, stores
 from vindao_agents.builders import MessageBuilder
@@ -116,8 +117,8 @@ class Agent:
         """Invoke the agent's reasoning and tool usage process."""
         if max_iterations is None:
             max_iterations = self.config.max_iterations
-        accumulated_reasoning = ""
-        accumulated_content = ""
+        reasoning_buffer = StringIO()
+        content_buffer = StringIO()
         tool_call_enabled = True
 
         if iteration == max_iterations - 1:
@@ -130,35 +131,42 @@ class Agent:
 
         for chunk, chunk_type in self.inference_adapter.complete_chat(self.state.messages):
             if chunk_type == "reasoning":
-                accumulated_reasoning += chunk
+                reasoning_buffer.write(chunk)
 
             elif chunk_type == "content":
-                accumulated_content += chunk
+                content_buffer.write(chunk)
             yield chunk, chunk_type
+            # Only materialize the content when the new chunk could complete a tool call
+            if not (tool_call_enabled and chunk_type == "content" and self.parser.should_parse(chunk)):
+                continue
+            accumulated_content = content_buffer.getvalue()
             if accumulated_content.startswith("@DISABLE_TOOL_CALL@"):
                 tool_call_enabled = False
-            if tool_call_enabled:
-                call = self.parser.parse(accumulated_content, list(self.tools.keys()))
-                if call:
-                    tool_name, tool_call_str = call
-                    result = str(execute_tool_call(tool_call_str, self.tools[tool_name]))
-                    tool_call_obj = ToolCall(name=tool_name, call=tool_call_str, result=result)
-                    yield tool_call_obj, "tool"
-                    self.state.add_message(
+                continue
+            call = self.parser.parse(accumulated_content, list(self.tools))
+            if call:
+                tool_name, tool_call_str = call
+                result = str(execute_tool_call(tool_call_str, self.tools[tool_name]))
+                tool_call_obj = ToolCall(name=tool_name, call=tool_call_str, result=result)
+                yield tool_call_obj, "tool"
+                self.state.add_messages(
+                    (
                         AssistantMessage(
                             content=accumulated_content,
-                            reasoning_content=accumulated_reasoning.strip(),
+                            reasoning_content=reasoning_buffer.getvalue().strip(),
                             tool_call=tool_call_obj,
-                        )
+                        ),
+                        ToolMessage(content=tool_call_obj.result, name=tool_call_obj.name, tool_call=tool_call_obj),
                     )
-                    self.state.add_message(
-                        ToolMessage(content=tool_call_obj.result, name=tool_call_obj.name, tool_call=tool_call_obj)
-                    )
-                    return (yield from self.invoke(iteration + 1, max_iterations=max_iterations))
+                )
+                return (yield from self.invoke(iteration + 1, max_iterations=max_iterations))
 
+        accumulated_content = content_buffer.getvalue()
         if accumulated_content.startswith("@DISABLE_TOOL_CALL@"):
             accumulated_content = accumulated_content.replace("@DISABLE_TOOL_CALL@", "", 1).lstrip()
-        self.state.add_message(AssistantMessage(content=accumulated_content, reasoning_content=accumulated_reasoning))
+        self.state.add_message(
+            AssistantMessage(content=accumulated_content, reasoning_content=reasoning_buffer.getvalue())
+        )
         if self.config.auto_save:
             self.store.save(self)
 
@@ -190,9 +198,9 @@ class Agent:
         return cls(**data)
 
     @classmethod
-    def from_json_string(cls, json_str: str) -> "Agent":
+    def from_json_string(cls, json_str: str | bytes) -> "Agent":
         """Create an Agent instance from a JSON string."""
-        data = json.loads(json_str)
+        data = from_json(json_str)
         config_data = data.get("config", {})
         state_data = data.get("state", {})
         messages = load_messages_from_dicts(state_data.get("messages", []))
@@ -202,7 +210,7 @@ class Agent:
     @classmethod
     def from_json_file(cls, path: str | Path) -> "Agent":
         """Create an Agent instance from a JSON file."""
-        data = Path(path).read_text()
+        data = Path(path).read_bytes()
         return cls.from_json_string(data)
 
     @classmethod
@@ -1,8 +1,10 @@
 # stdlib
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+# third party
+from pydantic_core import to_json
+
 # local
 from .AgentStore import AgentStore
 
@@ -18,11 +20,8 @@ class JsonAgentStore(AgentStore):
         else:
             path = Path(path)
 
-        data = {
-            "config": agent.config.model_dump(),
-            "state": agent.state.model_dump(),
-        }
+        # Serialize the models directly in pydantic-core instead of model_dump() + json.dump
+        data = to_json({"config": agent.config, "state": agent.state}, indent=4)
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        path.write_bytes(data)
@@ -1,10 +1,11 @@
 """Inference adapter for LiteLLM model integration."""
 
 # stdlib
+import logging
+import random
+from collections.abc import Callable
 from time import sleep
-
-# third party
-import litellm
+from typing import Any
 
 from vindao_agents.formatters import format_exception
 
@@ -13,6 +14,25 @@ from vindao_agents.InferenceAdapters.InferenceAdapter import InferenceAdapter
 from vindao_agents.models.messages import MessageType
 from vindao_agents.utils import get_default_logger
 
+# Role -> formatter dispatch table used by LiteLLMInferenceAdapter._formatMessages.
+# Dicts are built directly from attributes, which is much cheaper than model_dump().
+_MESSAGE_FORMATTERS: dict[str, Callable[[Any], dict]] = {
+    "system": lambda m: {"role": "system", "content": m.content},
+    "user": lambda m: {"role": "user", "content": m.content, "name": m.name},
+    "assistant": lambda m: {"role": "assistant", "content": m.content, "name": m.name},
+    # Tool results are sent as user messages carrying the tool name to stay provider and model agnostic
+    "tool": lambda m: {"role": "user", "content": m.content, "name": m.name},
+}
+
+# Upper bound in seconds for a single retry delay
+_MAX_BACKOFF = 30.0
+
+
+def _backoff_delay(retry: int) -> float:
+    """Exponential backoff with jitter, so concurrent clients do not retry in lockstep."""
+    delay = min(2.0**retry, _MAX_BACKOFF)
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311 - jitter, not cryptography
+
 
 class LiteLLMInferenceAdapter(InferenceAdapter):
     def __init__(self, provider: str, model: str):
@@ -20,40 +40,56 @@ class LiteLLMInferenceAdapter(InferenceAdapter):
         super().__init__(provider, model)
         self.model_str = f"{provider}/{model}"
         self.logger = get_default_logger()
+        # Formatted prefix of the last message history, reused while the history only grows
+        self._formatted_source: list[MessageType] = []
+        self._formatted_cache: list[dict] = []
 
     def complete_chat(self, messages: list[MessageType], max_retries: int = 5, retry: int = 0):
+        # litellm takes seconds to import, so defer it until a completion is actually requested
+        import litellm
+
         formatted_messages = self._formatMessages(messages)
-        try:
-            response = litellm.completion(model=self.model_str, messages=formatted_messages, stream=True)
-
-            for chunk in response:
-                delta = chunk.choices[0].delta
-                delta_reasoning_content = delta.get("reasoning_content", None)
-                if delta_reasoning_content:
-                    yield delta_reasoning_content, "reasoning"
-                delta_content = delta.get("content", None)
-                if delta_content:
-                    yield delta_content, "content"
-        except Exception as e:
-            if retry < max_retries:
-                self.logger.warning(f"{format_exception(e)}. Retrying {retry + 1}/{max_retries}...")
-                sleep(2**retry)  # Exponential backoff
-                yield from self.complete_chat(messages, max_retries, retry + 1)
-            else:
-                raise e
+        while True:
+            try:
+                response = litellm.completion(model=self.model_str, messages=formatted_messages, stream=True)
+
+                for chunk in response:
+                    delta = chunk.choices[0].delta
+                    delta_reasoning_content = delta.get("reasoning_content", None)
+                    if delta_reasoning_content:
+                        yield delta_reasoning_content, "reasoning"
+                    delta_content = delta.get("content", None)
+                    if delta_content:
+                        yield delta_content, "content"
+                return
+            except Exception as e:
+                if retry >= max_retries:
+                    raise e
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning("%s. Retrying %d/%d...", format_exception(e), retry + 1, max_retries)
+                sleep(_backoff_delay(retry))
+                retry += 1
 
     def _formatMessages(self, messages: list[MessageType]) -> list[dict]:
-        """Convert internal message objects to litellm-compatible format with tool call handling."""
-        formatted_messages = []
-        for message in messages:
-            if message.role != "system":
-                msg = message.model_dump(include={"role", "content", "name"})
-                if message.role == "tool":
-                    # For tool messages, set role to "user" and include tool name
-                    # This is to stay provider and model agnostic
-                    msg["role"] = "user"
-                formatted_messages.append(msg)
-            else:
-                formatted_messages.append(message.model_dump())
-
-        return formatted_messages
+        """Convert internal message objects to litellm-compatible format with tool call handling.
+
+        Only messages appended since the previous call are formatted; the already formatted
+        prefix is reused as long as it still matches the given history.
+        """
+        upto = len(self._formatted_source)
+        # Agent histories are append-only, so matching the first and last formatted message by
+        # identity is enough to tell that the cached prefix still applies
+        if not (
+            0 < upto <= len(messages)
+            and messages[0] is self._formatted_source[0]
+            and messages[upto - 1] is self._formatted_source[-1]
+        ):
+            upto = 0
+            self._formatted_source = []
+            self._formatted_cache = []
+
+        new_messages = messages[upto:]
+        self._formatted_cache.extend([_MESSAGE_FORMATTERS[message.role](message) for message in new_messages])
+        self._formatted_source.extend(new_messages)
+        # litellm edits message dicts in place (e.g. popping "name"), so hand out shallow copies
+        return [dict(message) for message in self._formatted_cache]
@@ -2,11 +2,29 @@
 
 # stdlib
 import inspect
+import weakref
 from collections.abc import Callable
+from functools import cached_property
 
 # local
 from vindao_agents.formatters.format_exception import format_exception
 
+# Source text per function, shared by every Tool (and agent) wrapping the same function.
+# Weak keys so the cache never keeps a wrapped function, or the globals it references, alive.
+_SOURCE_CACHE: weakref.WeakKeyDictionary[Callable, str] = weakref.WeakKeyDictionary()
+
+
+def _get_source(func: Callable) -> str:
+    """Return the source of a function, reading it only once per function."""
+    try:
+        source = _SOURCE_CACHE.get(func)
+    except TypeError:
+        # Callables without weak reference support are read every time
+        return inspect.getsource(func)
+    if source is None:
+        source = _SOURCE_CACHE[func] = inspect.getsource(func)
+    return source
+
 
 class Tool:
     """Function wrapper extracting metadata and parameters for dynamic tool registration and execution."""
@@ -14,16 +32,30 @@ class Tool:
     def __init__(self, func: Callable) -> None:
         self.name = func.__name__
         self.description = inspect.getdoc(func)
-        self.source = inspect.getsource(func)
-        self.signature = inspect.signature(func)
         self.func = func
+        # Rendered instructions keyed by include_source; the wrapped function never changes
+        self._instructions: dict[bool, str] = {}
+
+    @cached_property
+    def source(self) -> str:
+        """Source code of the wrapped function, read on first access."""
+        return _get_source(self.func)
+
+    @cached_property
+    def signature(self) -> inspect.Signature:
+        """Signature of the wrapped function, computed on first access."""
+        return inspect.signature(self.func)
 
     def to_instruction(self, include_source: bool = False) -> str:
         """Generate a string representation of the tool for inclusion in prompts or documentation."""
-        if include_source:
-            return self.source + "\n\n"
-        else:
-            return f'def {self.name}{self.signature}\n\t"""{self.description}"""\n\n'
+        instruction = self._instructions.get(include_source)
+        if instruction is None:
+            if include_source:
+                instruction = self.source + "\n\n"
+            else:
+                instruction = f'def {self.name}{self.signature}\n\t"""{self.description}"""\n\n'
+            self._instructions[include_source] = instruction
+        return instruction
 
     def __call__(self, *args, **kwargs) -> str:
         """Invoke the wrapped function with the extracted parameters."""
@@ -6,6 +6,9 @@ import re
 # local
 from .ToolParser import ToolParser
 
+# Matches any @identifier(...) call; the identifier is checked against the tool names afterwards
+_CALL_PATTERN = re.compile(r"@(\w+)\s*\(([^()]*(?:\([^()]*\)[^()]*)*)\)")
+
 
 class AtSyntaxParser(ToolParser):
     """Parser for tool calls in the format @tool_name(...).
@@ -30,16 +33,22 @@ class AtSyntaxParser(ToolParser):
             >>> parser.parse("Let me @read_file('test.txt')", ["read_file"])
             ('read_file', "read_file('test.txt')")
         """
-        # Pattern to match @{tool_name}(...) where tool_name is in tool_names
-        pattern = r"@(" + "|".join(re.escape(name) for name in tool_names) + r")\s*\(([^()]*(?:\([^()]*\)[^()]*)*)\)"
-        match = re.search(pattern, content)
-
-        if match:
+        # A single precompiled scan for @identifier(...) candidates, independent of the number of
+        # tools, instead of compiling a fresh alternation of all tool names on every call
+        match = _CALL_PATTERN.search(content)
+        while match:
             tool_name = match.group(1)
-            tool_call = match.group(0)[1:]  # Remove the '@' symbol
-            return tool_name, tool_call
+            if tool_name in tool_names:
+                tool_call = match.group(0)[1:]  # Remove the '@' symbol
+                return tool_name, tool_call
+            # Unknown names may wrap a valid call, so resume right after this '@'
+            match = _CALL_PATTERN.search(content, match.start() + 1)
         return None
 
+    def should_parse(self, chunk: str) -> bool:
+        """Only chunks containing a closing parenthesis can complete an @-syntax call."""
+        return ")" in chunk
+
     def get_instructions(self) -> str:
         """Get instructions for the LLM on how to format tool calls using @-syntax.
 
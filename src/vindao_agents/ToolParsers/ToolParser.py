@@ -25,6 +25,20 @@ class ToolParser(ABC):
         """
         pass
 
+    def should_parse(self, chunk: str) -> bool:
+        """Tell whether a newly streamed content chunk could complete a tool call.
+
+        The agent only re-parses its accumulated content when this returns True, so
+        parsers can skip the re-scan for chunks that cannot finish a call.
+
+        Args:
+            chunk: The content chunk just appended to the response
+
+        Returns:
+            True if the accumulated content should be parsed again, False otherwise.
+        """
+        return True
+
     @abstractmethod
     def get_instructions(self) -> str:
         """Get the instructions for the LLM on how to format tool calls.
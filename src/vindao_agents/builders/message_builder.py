@@ -75,7 +75,4 @@ class MessageBuilder:
         Returns:
             Formatted string containing all tool instructions
         """
-        tool_str = ""
-        for tool in tools.values():
-            tool_str += tool.to_instruction(include_source=include_source)
-        return tool_str.strip()
+        return "".join(tool.to_instruction(include_source=include_source) for tool in tools.values()).strip()
@@ -6,6 +6,8 @@ import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from vindao_agents.models.tool import ToolCall
     from vindao_agents.utils import AgentLogger
 
@@ -29,34 +31,51 @@ class ConsoleFormatter:
             logger: Logger instance for non-streaming messages
         """
         self.logger = logger
+        # Event type -> handler, so each streamed chunk costs a single dict lookup
+        self._handlers: dict[str, Callable[[str | ToolCall], None]] = {
+            "content": self._write_chunk,
+            "reasoning": self._write_chunk,
+            "tool": self._write_tool,
+        }
 
     def display_event(self, chunk: str | ToolCall, chunk_type: str) -> None:
         """Display an agent event to the console.
 
+        Unknown event types are ignored.
+
         Args:
             chunk: The content to display (text chunk or ToolCall)
             chunk_type: Type of event ("content", "reasoning", or "tool")
         """
-        if chunk_type in ["content", "reasoning"]:
-            # Stream text chunks without newlines
-            sys.stdout.write(str(chunk))
-            sys.stdout.flush()
-        elif chunk_type == "tool":
-            # Format and display tool call results
-            if isinstance(chunk, str):
-                sys.stdout.write(f" =>\n{chunk}\n")
-            else:
-                sys.stdout.write(f" =>\n{chunk.result}\n")
+        handler = self._handlers.get(chunk_type)
+        if handler is not None:
+            handler(chunk)
+
+    def _write_chunk(self, chunk: str | ToolCall) -> None:
+        """Stream text chunks without newlines, flushing only once a line is complete."""
+        text = str(chunk)
+        sys.stdout.write(text)
+        if "\n" in text:
             sys.stdout.flush()
 
+    def _write_tool(self, chunk: str | ToolCall) -> None:
+        """Format and display tool call results."""
+        if isinstance(chunk, str):
+            sys.stdout.write(f" =>\n{chunk}\n")
+        else:
+            sys.stdout.write(f" =>\n{chunk.result}\n")
+        sys.stdout.flush()
+
     def display_message(self, message: str) -> None:
         """Display a non-streaming message.
 
         Args:
             message: The message to display
         """
+        sys.stdout.flush()
         self.logger.info(message)
 
     def display_newline(self) -> None:
         """Display a newline after agent response."""
+        sys.stdout.flush()
         self.logger.info("")
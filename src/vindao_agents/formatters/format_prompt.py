@@ -1,10 +1,21 @@
 """Utility functions for loading and formatting prompt templates."""
 
+# stdlib
+from functools import lru_cache
+
 # third party
 from jinja2 import Template
 
 
+@lru_cache(maxsize=32)
+def _compile_template(text: str) -> Template:
+    """Compile a template once per distinct source text."""
+    # Template.__new__ is untyped in jinja2, so pin the type for callers
+    template: Template = Template(text)
+    return template
+
+
 def format_prompt(text: str, data: dict) -> str:
     """Format a prompt template with the given data."""
-    template = Template(text)
+    template = _compile_template(text)
     return template.render(**data)
@@ -1,25 +1,38 @@
 """Markdown parser extracting YAML frontmatter and content for configuration files."""
 
 # stdlib
+from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
-# third party
-import frontmatter
+# Parsed files keyed by path, reused while the path names the same file (device, inode) with unchanged (mtime, size)
+_cache: dict[Path, tuple[tuple[int, int, int, int], dict[str, Any], str]] = {}
 
 
 def load_markdown_with_frontmatter(file_path: str) -> tuple[dict[str, Any], str]:
     """Load markdown files with YAML frontmatter into structured metadata and content."""
     path = Path(file_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Markdown file not found: {file_path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Markdown file not found: {file_path}") from None
+
+    version = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        # Callers may mutate the metadata, so never hand out the cached instance
+        return deepcopy(cached[1]), cached[2]
+
+    # third party, imported on first use to keep package import light
+    import frontmatter
 
     try:
         with open(path, encoding="utf-8") as f:
             post = frontmatter.load(f)
 
-        return post.metadata, post.content
-
     except Exception as e:
         raise ValueError(f"Failed to parse markdown frontmatter in {file_path}: {e!s}")
+
+    _cache[path] = (version, deepcopy(post.metadata), post.content)
+    return post.metadata, post.content
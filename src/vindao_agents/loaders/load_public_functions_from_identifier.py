@@ -2,24 +2,21 @@
 
 # stdlib
 from collections.abc import Callable
+from types import FunctionType
 from typing import Any
 
 
 def load_public_functions_from_identifier(identifier: str) -> list[tuple[str, Callable[..., Any]]]:
     """Load public functions from a given module identifier."""
     import importlib
-    import inspect
 
     try:
         module = importlib.import_module(identifier)
     except ModuleNotFoundError:
         module = importlib.import_module("vindao_agents." + identifier)
-    loaded: list[tuple[str, Callable[..., Any]]] = []
-    for name, obj in inspect.getmembers(module):
-        if name.startswith("_"):
-            continue
-        if name.startswith("test_"):
-            continue
-        if inspect.isfunction(obj):
-            loaded.append((name, obj))
-    return loaded
+    # vars() avoids the sort and per-name getattr of inspect.getmembers
+    return [
+        (name, obj)
+        for name, obj in vars(module).items()
+        if not name.startswith(("_", "test_")) and isinstance(obj, FunctionType)
+    ]
@@ -1,6 +1,7 @@
 """CLI entry point for Vindao Agents."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -14,14 +15,14 @@ def list_agents():
         print("No agents directory found.")
         return
 
-    agent_files = sorted(agents_dir.glob("*.md"))
-    if not agent_files:
+    with os.scandir(agents_dir) as entries:
+        agent_names = sorted(entry.name.removesuffix(".md") for entry in entries if entry.name.endswith(".md"))
+    if not agent_names:
         print("No agents found.")
         return
 
     print("Available agents:")
-    for agent_file in agent_files:
-        agent_name = agent_file.stem
+    for agent_name in agent_names:
         print(f"  - {agent_name}")
 
 
@@ -1,7 +1,8 @@
 """Models for agent configuration and state management."""
 
 # stdlib
-from datetime import UTC, datetime
+from collections.abc import Iterable
+from time import time
 
 # third party
 from pydantic import BaseModel, Field
@@ -45,4 +46,10 @@ class AgentState(BaseModel):
     def add_message(self, message: MessageType) -> None:
         """Add a new message to the agent's message history and update the timestamp."""
         self.messages.append(message)
-        self.updated_at = datetime.now(UTC).timestamp()
+        # time() is the same UTC epoch timestamp without allocating a datetime
+        self.updated_at = time()
+
+    def add_messages(self, messages: Iterable[MessageType]) -> None:
+        """Add several messages to the history at once, updating the timestamp a single time."""
+        self.messages.extend(messages)
+        self.updated_at = time()
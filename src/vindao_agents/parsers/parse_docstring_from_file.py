@@ -4,12 +4,24 @@
 import ast
 from pathlib import Path
 
+# Docstrings keyed by path, reused while the path names the same file (device, inode) with unchanged (mtime, size)
+_cache: dict[Path, tuple[tuple[int, int, int, int], str | None]] = {}
+
 
 def parse_docstring_from_file(file_path: Path) -> str | None:
     """Extract docstring from a Python file without executing it."""
     try:
+        stat = file_path.stat()
+        version = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = _cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         source = file_path.read_text(encoding="utf-8")
         tree = ast.parse(source)
-        return ast.get_docstring(tree)
+        docstring = ast.get_docstring(tree)
     except Exception:
         return None
+
+    _cache[file_path] = (version, docstring)
+    return docstring
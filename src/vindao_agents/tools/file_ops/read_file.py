@@ -5,4 +5,5 @@ def read_file(path: str) -> str:
     """Read the content of a specified file."""
     from pathlib import Path
 
-    return Path(path).read_text()
+    # Read the raw bytes in one call and decode once, skipping the text-mode codec and newline layer
+    return Path(path).read_bytes().decode("utf-8")
@@ -6,11 +6,11 @@ from .read_file import read_file
 
 def read_files(*paths: str) -> str:
     """Read and return the contents of multiple files."""
-    response = ""
+    parts = []
     for file_path in paths:
-        response += f"\n# {file_path}\n"
+        parts.append(f"\n# {file_path}\n")
         try:
-            response += read_file(file_path)
+            parts.append(read_file(file_path))
         except Exception as e:
-            response += format_exception(e)
-    return response
+            parts.append(format_exception(e))
+    return "".join(parts)
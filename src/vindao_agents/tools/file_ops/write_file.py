@@ -7,5 +7,6 @@ def write_file(path: str, content: str) -> str:
     """Write content to a specified file."""
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(content)
+    # Encode once up front and write the bytes as-is, skipping the text-mode codec and newline layer
+    p.write_bytes(content.encode("utf-8"))
     return f"Content written to {p.resolve().as_posix()}"
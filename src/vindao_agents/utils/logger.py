@@ -3,6 +3,12 @@
 import logging
 from typing import Protocol
 
+# Loggers already configured by get_default_logger, so repeat calls skip logging's lock and setup
+_configured: dict[str, logging.Logger] = {}
+
+# Message-only formatter shared by every handler get_default_logger attaches
+_message_formatter = logging.Formatter("%(message)s")
+
 
 class AgentLogger(Protocol):
     """Protocol for agent logging interface."""
@@ -34,10 +40,15 @@ def get_default_logger(name: str = "vindao_agents") -> logging.Logger:
     Returns:
         A configured Logger instance.
     """
+    logger = _configured.get(name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.setFormatter(_message_formatter)
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
+    _configured[name] = logger
     return logger
@@ -1,5 +1,6 @@
 """Centralized path resolution utilities for vindao_agents framework."""
 
+import os
 from pathlib import Path
 
 
@@ -17,10 +18,11 @@ def resolve_path(filename: str, search_dirs: list[str | Path]) -> Path:
     Raises:
         FileNotFoundError: If the file is not found in any of the search directories
     """
+    # Probe with plain strings and only build a Path for the hit
     for directory in search_dirs:
-        candidate = Path(directory) / filename
-        if candidate.exists():
-            return candidate
+        candidate = os.path.join(os.fspath(directory), filename)
+        if os.path.exists(candidate):
+            return Path(candidate)
 
     raise FileNotFoundError(
         f"Could not find '{filename}' in any of the following directories: {[str(Path(d)) for d in search_dirs]}"
@@ -44,11 +46,12 @@ def resolve_path_with_fallbacks(filenames: list[str], search_dirs: list[str | Pa
     Raises:
         FileNotFoundError: If none of the files are found in any directory
     """
+    directories = [os.fspath(d) for d in search_dirs]
     for filename in filenames:
-        for directory in search_dirs:
-            candidate = Path(directory) / filename
-            if candidate.exists():
-                return candidate
+        for directory in directories:
+            candidate = os.path.join(directory, filename)
+            if os.path.exists(candidate):
+                return Path(candidate)
 
     raise FileNotFoundError(
         f"Could not find any of {filenames} in any of the following directories: {[str(Path(d)) for d in search_dirs]}"
@@ -1,11 +1,13 @@
 # stdlib
-import json
+import os
+import time
 from os import getenv
 from pathlib import Path
 
 # third-party
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import from_json
 
 # local
 from vindao_agents import Agent
@@ -15,6 +17,16 @@ USER_DATA_DIR = getenv("USER_DATA_DIR", Path.cwd() / ".vindao_agents")
 
 app = FastAPI()
 
+# Growth schedule for batching streamed content chunks over the websocket
+_MIN_BATCH_SIZE = 1
+_BATCH_SIZE_GROWTH_FACTOR = 3
+_MAX_BATCH_SIZE = 50
+# Longest a content chunk may wait in a batch, so slow models still stream smoothly
+_MAX_BATCH_DELAY = 0.1
+
+# Parsed session files keyed by path, reused while the path names the same file (device, inode) with unchanged (mtime, size)
+_session_cache: dict[str, tuple[tuple[int, int, int, int], dict]] = {}
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -29,12 +41,21 @@ app.add_middleware(
 async def get_all_sessions():
     sessions_path = Path(USER_DATA_DIR) / "sessions"
     sessions = {}
-    print(sessions_path)
-    for file in sessions_path.iterdir():
-        print(file.suffix)
-        if file.suffix == ".json":
-            with open(file) as f:
-                sessions[file.stem] = json.load(f)
+    seen = set()
+    with os.scandir(sessions_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            stat = entry.stat()
+            version = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = _session_cache.get(entry.path)
+            if cached is None or cached[0] != version:
+                with open(entry.path, "rb") as f:
+                    cached = _session_cache[entry.path] = (version, from_json(f.read()))
+            seen.add(entry.path)
+            sessions[entry.name.removesuffix(".json")] = cached[1]
+    for stale in _session_cache.keys() - seen:
+        del _session_cache[stale]
     return sessions
 
 
@@ -43,18 +64,17 @@ async def get_session(session_id: str):
     session_path = Path(USER_DATA_DIR) / "sessions" / f"{session_id}.json"
     if not session_path.exists():
         return {"error": "Session not found"}
-    with open(session_path) as f:
-        session_data = json.load(f)
-    return session_data
+    return from_json(session_path.read_bytes())
 
 
 @app.get("/agents")
 async def get_agents():
     agents_path = Path(USER_DATA_DIR) / "agents"
     agents = {}
-    for file in agents_path.iterdir():
-        if file.suffix == ".md":
-            agents[file.stem] = load_agent_from_markdown(file)
+    with os.scandir(agents_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md"):
+                agents[entry.name.removesuffix(".md")] = load_agent_from_markdown(entry.path)
     return {"agents": agents}
 
 
@@ -64,8 +84,27 @@ async def websocket_endpoint(websocket: WebSocket):
     while True:
         data = await websocket.receive_text()
         agent = Agent.from_json_string(data)
+        # Content chunks are sent in batches that grow from one chunk (fast first token)
+        # up to _MAX_BATCH_SIZE, cutting per-message overhead on long replies. A batch is
+        # flushed early once _MAX_BATCH_DELAY has passed since the last send.
+        batch: list[str] = []
+        batch_size = _MIN_BATCH_SIZE
+        last_send = time.monotonic()
         for chunk, chunk_type in agent.invoke():
             if chunk_type == "content":
-                await websocket.send_json({"type": "content", "data": chunk})
+                batch.append(chunk)
+                if len(batch) >= batch_size or time.monotonic() - last_send >= _MAX_BATCH_DELAY:
+                    await websocket.send_json({"type": "content", "data": "".join(batch)})
+                    batch.clear()
+                    batch_size = min(batch_size * _BATCH_SIZE_GROWTH_FACTOR, _MAX_BATCH_SIZE)
+                    last_send = time.monotonic()
             elif chunk_type == "tool":
+                if batch:
+                    await websocket.send_json({"type": "content", "data": "".join(batch)})
+                    batch.clear()
                 await websocket.send_json({"type": "tool", "data": chunk.result})
+                # The reply after a tool call starts a new stream, so it gets a fast first token again
+                batch_size = _MIN_BATCH_SIZE
+                last_send = time.monotonic()
+        if batch:
+            await websocket.send_json({"type": "content", "data": "".join(batch)})
@@ -1,12 +1,17 @@
 """Tests for LiteLLM Inference Adapter."""
 
-# third party
+# stdlib
+import importlib
 
+# third party
 # local
 from vindao_agents.InferenceAdapters.LiteLLMInferenceAdapter import LiteLLMInferenceAdapter
 from vindao_agents.models.messages import AssistantMessage, SystemMessage, ToolMessage, UserMessage
 from vindao_agents.models.tool import ToolCall
 
+# The package re-exports the class under the module's name, so fetch the module itself for patching
+adapter_module = importlib.import_module("vindao_agents.InferenceAdapters.LiteLLMInferenceAdapter")
+
 
 class TestLiteLLMInferenceAdapter:
     adapter = LiteLLMInferenceAdapter(provider="ollama", model="qwen2.5:0.5b")
@@ -27,6 +32,25 @@ class TestLiteLLMInferenceAdapter:
         assert formatted[3]["role"] == "user"  # Tool message role changed to user
         assert formatted[3]["name"] == "sample_tool"
 
+    def test_formatMessages_reuses_formatted_prefix(self):
+        adapter = LiteLLMInferenceAdapter(provider="ollama", model="qwen2.5:0.5b")
+        messages = [SystemMessage(content="System content"), UserMessage(content="First")]
+        first = adapter._formatMessages(messages)
+
+        messages.append(AssistantMessage(content="Answer"))
+        second = adapter._formatMessages(messages)
+        assert second[:2] == first
+        assert second[2] == {"role": "assistant", "content": "Answer", "name": None}
+
+        # Callers such as litellm may edit the returned dicts; the cached prefix must not change
+        second[1].pop("name")
+        third = adapter._formatMessages(messages)
+        assert third[1] == {"role": "user", "content": "First", "name": None}
+
+        # A different history invalidates the cached prefix
+        other = adapter._formatMessages([UserMessage(content="Other")])
+        assert [m["content"] for m in other] == ["Other"]
+
     def test_completion_retry(self, monkeypatch):
         from unittest.mock import MagicMock
 
@@ -49,9 +73,32 @@ class TestLiteLLMInferenceAdapter:
 
             return iter([mock_chunk])
 
-        # Patch litellm.completion function
+        delays = []
+
+        # Patch litellm.completion function and skip the real backoff sleeps
         monkeypatch.setattr(litellm, "completion", mock_completion)
+        monkeypatch.setattr(adapter_module, "sleep", lambda seconds: delays.append(seconds))
 
         results = list(self.adapter.complete_chat(messages, max_retries=5))
         assert results == [("Final content", "content")]
         assert call_count["count"] == 3  # Ensure it retried twice before succeeding
+        assert len(delays) == 2
+        assert 0.5 <= delays[0] <= 1.0
+        assert 1.0 <= delays[1] <= 2.0
+
+    def test_completion_gives_up_after_max_retries(self, monkeypatch):
+        import litellm
+        import pytest
+
+        def mock_completion(*args, **kwargs):
+            raise RuntimeError("Always failing")
+
+        monkeypatch.setattr(litellm, "completion", mock_completion)
+        monkeypatch.setattr(adapter_module, "sleep", lambda seconds: None)
+
+        with pytest.raises(RuntimeError, match="Always failing"):
+            list(self.adapter.complete_chat([UserMessage(content="Test content")], max_retries=2))
+
+    def test_backoff_delay_is_capped(self):
+        cap = adapter_module._MAX_BACKOFF
+        assert all(cap / 2 <= adapter_module._backoff_delay(20) <= cap for _ in range(20))
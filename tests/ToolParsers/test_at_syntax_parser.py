@@ -0,0 +1,33 @@
+"""Tests for AtSyntaxParser."""
+
+# local
+from vindao_agents.ToolParsers import AtSyntaxParser
+
+
+class TestAtSyntaxParser:
+    parser = AtSyntaxParser()
+
+    def test_parse_tool_call(self):
+        result = self.parser.parse("Let me @read_file('test.txt') now", ["read_file", "write_file"])
+        assert result == ("read_file", "read_file('test.txt')")
+
+    def test_parse_nested_parentheses(self):
+        result = self.parser.parse("@bash(cmd=str(1))", ["bash"])
+        assert result == ("bash", "bash(cmd=str(1))")
+
+    def test_parse_ignores_unknown_and_prefixed_names(self):
+        assert self.parser.parse("@unknown('x') @read_filex('y')", ["read_file"]) is None
+
+    def test_parse_finds_call_inside_unknown_call(self):
+        result = self.parser.parse("@note(@read_file('a'))", ["read_file"])
+        assert result == ("read_file", "read_file('a')")
+
+    def test_parse_incomplete_call(self):
+        assert self.parser.parse("@read_file('test.txt'", ["read_file"]) is None
+
+    def test_parse_without_tools(self):
+        assert self.parser.parse("@(1)", []) is None
+
+    def test_should_parse(self):
+        assert self.parser.should_parse("txt')")
+        assert not self.parser.should_parse("@read_file(")
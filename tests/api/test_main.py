@@ -0,0 +1,120 @@
+"""Tests for the vindao_agents_api websocket endpoint."""
+
+# stdlib
+import asyncio
+import itertools
+import os
+from types import SimpleNamespace
+
+# third party
+import pytest
+from fastapi import WebSocketDisconnect
+
+# local
+from vindao_agents.models.tool import ToolCall
+from vindao_agents_api import main
+
+TOOL_CALL = ToolCall(name="double", call="double(2)", result="4")
+
+STREAM = (
+    ("a", "content"),
+    ("b", "content"),
+    ("c", "content"),
+    ("d", "content"),
+    ("thinking", "reasoning"),
+    (TOOL_CALL, "tool"),
+    ("e", "content"),
+    ("f", "content"),
+    ("g", "content"),
+)
+
+
+class StubAgent:
+    """Agent stand-in that replays a fixed stream of chunks."""
+
+    @classmethod
+    def from_json_string(cls, data: str) -> "StubAgent":
+        return cls()
+
+    def invoke(self):
+        return iter(STREAM)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that delivers one request, records sent frames, then disconnects."""
+
+    def __init__(self):
+        self.requests = ["{}"]
+        self.frames: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive_text(self) -> str:
+        if not self.requests:
+            raise WebSocketDisconnect()
+        return self.requests.pop()
+
+    async def send_json(self, data: dict) -> None:
+        self.frames.append(data)
+
+
+def run_endpoint() -> list[dict]:
+    """Run the websocket handler for a single request and return the frames it sent."""
+    websocket = FakeWebSocket()
+    with pytest.raises(WebSocketDisconnect):
+        asyncio.run(main.websocket_endpoint(websocket))
+    return websocket.frames
+
+
+class TestWebsocketEndpoint:
+    @pytest.fixture(autouse=True)
+    def _stub_agent(self, monkeypatch):
+        monkeypatch.setattr(main, "Agent", StubAgent)
+
+    def test_batches_grow_and_reset_after_tool(self, monkeypatch):
+        """Test that batches grow, flush before a tool frame, restart small after it and flush the rest."""
+        monkeypatch.setattr(main, "time", SimpleNamespace(monotonic=lambda: 0.0))
+
+        assert run_endpoint() == [
+            {"type": "content", "data": "a"},
+            {"type": "content", "data": "bcd"},
+            {"type": "tool", "data": "4"},
+            {"type": "content", "data": "e"},
+            {"type": "content", "data": "fg"},
+        ]
+
+    def test_slow_chunks_are_flushed_after_max_delay(self, monkeypatch):
+        """Test that content waiting longer than the batch delay is sent without filling the batch."""
+        # Every clock reading is a full second later, well past the batch delay
+        clock = itertools.count()
+        monkeypatch.setattr(main, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+
+        assert run_endpoint() == [
+            {"type": "content", "data": "a"},
+            {"type": "content", "data": "b"},
+            {"type": "content", "data": "c"},
+            {"type": "content", "data": "d"},
+            {"type": "tool", "data": "4"},
+            {"type": "content", "data": "e"},
+            {"type": "content", "data": "f"},
+            {"type": "content", "data": "g"},
+        ]
+
+
+class TestGetAllSessions:
+    def test_replaced_session_file_is_reparsed(self, tmp_path, monkeypatch):
+        """Test that a session file replaced with same-sized content and mtime is parsed again."""
+        monkeypatch.setattr(main, "USER_DATA_DIR", tmp_path)
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        session_file = sessions_dir / "abc.json"
+        session_file.write_bytes(b'{"v": 1}')
+        os.utime(session_file, ns=(0, 0))
+        assert asyncio.run(main.get_all_sessions()) == {"abc": {"v": 1}}
+
+        replacement = sessions_dir / "abc.json.tmp"
+        replacement.write_bytes(b'{"v": 2}')
+        os.utime(replacement, ns=(0, 0))
+        replacement.replace(session_file)
+        assert asyncio.run(main.get_all_sessions()) == {"abc": {"v": 2}}
@@ -1,12 +1,16 @@
 """Shared fixtures and configuration for pytest."""
 
 # stdlib
+import copy
 from collections.abc import Generator
 from pathlib import Path
 
 # third party
 import pytest
 
+# local
+from vindao_agents.Agent import Agent
+
 
 @pytest.fixture
 def tmp_path(tmp_path: Path) -> Generator[Path, None, None]:
@@ -14,7 +18,7 @@ def tmp_path(tmp_path: Path) -> Generator[Path, None, None]:
     yield tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool():
     """Provide a sample tool function for testing."""
 
@@ -33,7 +37,7 @@ def sample_tool():
     return multiply
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_with_exception():
     """Provide a sample tool that raises an exception."""
 
@@ -52,26 +56,22 @@ def sample_tool_with_exception():
     return divide
 
 
-@pytest.fixture
-def mock_inference_adapter_factory():
-    """Factory for creating mock inference adapters with custom responses."""
-
-    class MockInferenceAdapter:
-        """Mock inference adapter for testing."""
+@pytest.fixture(scope="session")
+def ro_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a user data directory shared by tests that never write to it."""
+    return tmp_path_factory.mktemp("ro_agent_data")
 
-        def __init__(self, provider: str, model: str, responses: list = None):
-            self.provider = provider
-            self.model = model
-            self.responses = responses or [("response", "content")]
-            self.call_count = 0
 
-        def complete_chat(self, messages, max_retries: int = 5, retry: int = 0):
-            """Mock complete_chat method that yields predefined responses."""
-            for chunk, chunk_type in self.responses:
-                yield chunk, chunk_type
-            self.call_count += 1
+@pytest.fixture(scope="session")
+def _agent_template(ro_data_dir: Path) -> Agent:
+    """Default-configured agent built once per session; use the agent fixture instead."""
+    return Agent(user_data_dir=ro_data_dir)
 
-    def factory(responses: list = None):
-        return lambda provider, model: MockInferenceAdapter(provider, model, responses)
 
-    return factory
+@pytest.fixture
+def agent(_agent_template: Agent) -> Agent:
+    """Provide a default-configured agent with its own config and state."""
+    agent = copy.copy(_agent_template)
+    agent.config = _agent_template.config.model_copy(deep=True)
+    agent.state = _agent_template.state.model_copy(deep=True)
+    return agent
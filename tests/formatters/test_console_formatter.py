@@ -1,120 +1,139 @@
 """Tests for ConsoleFormatter."""
 
-from io import StringIO
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from vindao_agents.formatters import ConsoleFormatter
 from vindao_agents.models.tool import ToolCall
 
+# Tool calls are only read by the formatter, so one instance per case is shared across tests
+TOOL_CALL = ToolCall(name="test_tool", call="test_tool(arg='value')", result="Tool executed successfully")
+READ_FILE_CALL = ToolCall(name="read_file", call="read_file(path='/tmp/test.txt')", result="File contents here")
+
+
+class FakeLogger:
+    """Minimal logger stand-in that records info messages."""
+
+    def __init__(self):
+        self.info_calls: list[str] = []
+
+    def info(self, message: str) -> None:
+        self.info_calls.append(message)
+
+    def debug(self, message: str) -> None:
+        pass
+
+    def warning(self, message: str) -> None:
+        pass
+
+    def error(self, message: str) -> None:
+        pass
+
 
 class TestConsoleFormatter:
     """Test suite for ConsoleFormatter class."""
 
-    @pytest.fixture
-    def mock_logger(self):
-        """Create a mock logger for testing."""
-        logger = Mock()
-        logger.info = Mock()
-        logger.debug = Mock()
-        logger.warning = Mock()
-        logger.error = Mock()
-        return logger
-
-    @pytest.fixture
-    def formatter(self, mock_logger):
-        """Create a ConsoleFormatter instance with mock logger."""
-        return ConsoleFormatter(mock_logger)
-
-    def test_init(self, mock_logger):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def fake_logger(cls):
+        """Create a fake logger shared by the tests in this class."""
+        return FakeLogger()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def formatter(cls, fake_logger):
+        """Create a ConsoleFormatter instance with fake logger."""
+        return ConsoleFormatter(fake_logger)
+
+    @pytest.fixture(autouse=True)
+    def _reset_fake_logger(self, fake_logger):
+        """Clear recorded logger calls after each test."""
+        yield
+        fake_logger.info_calls.clear()
+
+    def test_init(self, fake_logger):
         """Test ConsoleFormatter initialization."""
-        formatter = ConsoleFormatter(mock_logger)
-        assert formatter.logger is mock_logger
-
-    def test_display_event_content(self, formatter):
-        """Test displaying content chunks."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event("Hello", "content")
-            assert mock_stdout.getvalue() == "Hello"
-
-    def test_display_event_reasoning(self, formatter):
-        """Test displaying reasoning chunks."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event("Thinking...", "reasoning")
-            assert mock_stdout.getvalue() == "Thinking..."
-
-    def test_display_event_tool(self, formatter):
+        formatter = ConsoleFormatter(fake_logger)
+        assert formatter.logger is fake_logger
+
+    @pytest.mark.parametrize(
+        "chunks,kind,expected",
+        [
+            (["Hello"], "content", "Hello"),
+            (["Thinking..."], "reasoning", "Thinking..."),
+            ([""], "content", ""),
+            (["Special chars: \n\t\r\\"], "content", "Special chars: \n\t\r\\"),
+            # Streaming chunks are concatenated without newlines between them
+            (["Line1", "Line2"], "content", "Line1Line2"),
+        ],
+        ids=["content", "reasoning", "empty", "special_characters", "streaming_without_newlines"],
+    )
+    def test_display_event_passthrough(self, formatter, capsys, chunks, kind, expected):
+        """Test that content and reasoning chunks are written to stdout unchanged."""
+        for chunk in chunks:
+            formatter.display_event(chunk, kind)
+        assert capsys.readouterr().out == expected
+
+    def test_display_event_flushes_on_line_boundaries(self, formatter, monkeypatch):
+        """Test that partial lines stay buffered until a newline, tool result or message."""
+        stdout = Mock()
+        monkeypatch.setattr("sys.stdout", stdout)
+
+        formatter.display_event("Hello ", "content")
+        formatter.display_event("World", "content")
+        stdout.flush.assert_not_called()
+
+        formatter.display_event("!\n", "content")
+        assert stdout.flush.call_count == 1
+
+        formatter.display_event(TOOL_CALL, "tool")
+        assert stdout.flush.call_count == 2
+
+        formatter.display_newline()
+        assert stdout.flush.call_count == 3
+
+    def test_display_event_tool(self, formatter, capsys):
         """Test displaying tool call results."""
-        tool_call = ToolCall(name="test_tool", call="test_tool(arg='value')", result="Tool executed successfully")
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event(tool_call, "tool")
-            output = mock_stdout.getvalue()
-            assert " =>\n" in output
-            assert "Tool executed successfully" in output
-            assert output.endswith("\n")
-
-    def test_display_event_multiple_content_chunks(self, formatter):
+        formatter.display_event(TOOL_CALL, "tool")
+        output = capsys.readouterr().out
+        assert " =>\n" in output
+        assert "Tool executed successfully" in output
+        assert output.endswith("\n")
+
+    def test_display_event_multiple_content_chunks(self, formatter, capsys):
         """Test displaying multiple content chunks in sequence."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event("Hello ", "content")
-            formatter.display_event("World", "content")
-            formatter.display_event("!", "content")
-            assert mock_stdout.getvalue() == "Hello World!"
+        formatter.display_event("Hello ", "content")
+        formatter.display_event("World", "content")
+        formatter.display_event("!", "content")
+        assert capsys.readouterr().out == "Hello World!"
 
-    def test_display_message(self, formatter, mock_logger):
+    def test_display_event_unknown_kind(self, formatter, capsys):
+        """Test that unknown event types are ignored."""
+        formatter.display_event("ignored", "unknown")
+        assert capsys.readouterr().out == ""
+
+    def test_display_message(self, formatter, fake_logger):
         """Test displaying non-streaming messages."""
         formatter.display_message("Test message")
-        mock_logger.info.assert_called_once_with("Test message")
+        assert fake_logger.info_calls == ["Test message"]
 
-    def test_display_newline(self, formatter, mock_logger):
+    def test_display_newline(self, formatter, fake_logger):
         """Test displaying newline."""
         formatter.display_newline()
-        mock_logger.info.assert_called_once_with("")
-
-    def test_display_event_streaming_without_newlines(self, formatter):
-        """Test that streaming chunks don't add newlines."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event("Line1", "content")
-            formatter.display_event("Line2", "content")
-            output = mock_stdout.getvalue()
-            # Should be concatenated without newlines between them
-            assert output == "Line1Line2"
-            assert output.count("\n") == 0
-
-    def test_display_event_tool_formatting(self, formatter):
+        assert fake_logger.info_calls == [""]
+
+    def test_display_event_tool_formatting(self, formatter, capsys):
         """Test that tool results are properly formatted with arrow."""
-        tool_call = ToolCall(name="read_file", call="read_file(path='/tmp/test.txt')", result="File contents here")
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event(tool_call, "tool")
-            output = mock_stdout.getvalue()
-            # Check for arrow formatting
-            assert output.startswith(" =>")
-            assert "File contents here" in output
-
-    def test_display_message_multiple_calls(self, formatter, mock_logger):
+        formatter.display_event(READ_FILE_CALL, "tool")
+        output = capsys.readouterr().out
+        # Check for arrow formatting
+        assert output.startswith(" =>")
+        assert "File contents here" in output
+
+    def test_display_message_multiple_calls(self, formatter, fake_logger):
         """Test multiple display_message calls."""
         formatter.display_message("Message 1")
         formatter.display_message("Message 2")
         formatter.display_message("Message 3")
-        assert mock_logger.info.call_count == 3
-
-    def test_formatter_with_empty_content(self, formatter):
-        """Test displaying empty content."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event("", "content")
-            assert mock_stdout.getvalue() == ""
-
-    def test_formatter_with_special_characters(self, formatter):
-        """Test displaying content with special characters."""
-        special_text = "Special chars: \n\t\r\\"
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            formatter.display_event(special_text, "content")
-            assert mock_stdout.getvalue() == special_text
-
-    def test_formatter_preserves_logger_instance(self, mock_logger):
-        """Test that formatter preserves the logger instance."""
-        formatter = ConsoleFormatter(mock_logger)
-        assert formatter.logger is mock_logger
-        # Verify it's the exact same instance, not a copy
-        assert id(formatter.logger) == id(mock_logger)
+        assert fake_logger.info_calls == ["Message 1", "Message 2", "Message 3"]
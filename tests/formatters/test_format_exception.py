@@ -1,10 +1,14 @@
 """Tests for format_exception."""
 
-# third party
+# stdlib
+import re
 
+# third party
 # local
 from vindao_agents.formatters.format_exception import format_exception
 
+ZERO_DIVISION = re.compile(r"1 / 0.*ZeroDivisionError", re.S)
+
 
 class TestFormatException:
     def test_without_function(self):
@@ -12,8 +16,7 @@ class TestFormatException:
             1 / 0
         except Exception as e:
             formatted = format_exception(e)
-            assert "ZeroDivisionError" in formatted
-            assert "1 / 0" in formatted
+            assert ZERO_DIVISION.search(formatted)
 
     def test_with_function(self):
         def faulty_function():
@@ -23,9 +26,8 @@ class TestFormatException:
             faulty_function()
         except Exception as e:
             formatted = format_exception(e, faulty_function)
-            assert "ZeroDivisionError" in formatted
+            assert ZERO_DIVISION.search(formatted)
             assert "faulty_function" in formatted
-            assert "1 / 0" in formatted
 
     def test_no_duplicate_exception_message(self):
         """Test that exception message doesn't appear twice (Issue #10)."""
@@ -3,7 +3,7 @@
 # third party
 
 # local
-from vindao_agents.formatters.format_prompt import format_prompt
+from vindao_agents.formatters.format_prompt import _compile_template, format_prompt
 
 
 class TestFormatPrompt:
@@ -12,3 +12,10 @@ class TestFormatPrompt:
         data = {"name": "Alice", "place": "Wonderland"}
         formatted = format_prompt(template, data)
         assert formatted == "Hello, Alice! Welcome to Wonderland."
+
+    def test_format_prompt_reuses_compiled_template(self):
+        template = "Hi {{ name }}"
+        assert format_prompt(template, {"name": "A"}) == "Hi A"
+        compiled = _compile_template(template)
+        assert format_prompt(template, {"name": "B"}) == "Hi B"
+        assert _compile_template(template) is compiled
@@ -0,0 +1,13 @@
+"""Shared fixtures for loader tests."""
+
+# third party
+import pytest
+
+# local
+from vindao_agents.loaders.load_public_functions_from_identifier import load_public_functions_from_identifier
+
+
+@pytest.fixture(scope="session")
+def format_exception_publics():
+    """Public functions of the format_exception module, loaded once per session."""
+    return load_public_functions_from_identifier("vindao_agents.formatters.format_exception")
@@ -1,16 +1,17 @@
 """Tests for load_markdown_with_frontmatter."""
 
 # stdlib
+import hashlib
+import os
 from pathlib import Path
 
 # third party
+import pytest
+
 # local
 from vindao_agents.loaders.load_markdown_with_frontmatter import load_markdown_with_frontmatter
 
-
-class TestLoadMarkdownWithFrontmatter:
-    def test_parse_valid_markdown(self, tmp_path: Path):
-        md_content = """---
+MD_CONTENT = b"""---
 provider: openai
 model: gpt-4
 tools:
@@ -19,8 +20,37 @@ tools:
 ---
 You are an honest assistant working in a self-extending system. You always answer with brutal honesty and value simplicity over unnecessary complexity.
 """
-        md_file = tmp_path / "agent.md"
-        md_file.write_text(md_content, encoding="utf-8")
+
+INVALID_MD_CONTENT = b"""---
+provider: openai
+model gpt-4
+tools:  - tools.file_ops
+  - tools.bash
+---
+This is invalid markdown frontmatter.
+"""
+
+
+UNCLOSED_FLOW_MD_CONTENT = b"""---
+provider: [openai
+---
+Body
+"""
+
+
+@pytest.fixture(scope="session")
+def md_file(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the parametrized markdown content to a content-addressed file shared by the session."""
+    content: bytes = request.param
+    path = tmp_path_factory.getbasetemp() / f"{hashlib.sha256(content).hexdigest()}.md"
+    if not path.exists():
+        path.write_bytes(content)
+    return path
+
+
+class TestLoadMarkdownWithFrontmatter:
+    @pytest.mark.parametrize("md_file", [MD_CONTENT], indirect=True)
+    def test_parse_valid_markdown(self, md_file: Path):
         metadata, content = load_markdown_with_frontmatter(str(md_file))
         assert metadata["provider"] == "openai"
         assert metadata["model"] == "gpt-4"
@@ -28,23 +58,41 @@ You are an honest assistant working in a self-extending system. You always answe
         assert "You are an honest assistant" in content
 
     def test_parse_missing_file(self):
-        try:
+        with pytest.raises(FileNotFoundError, match="Markdown file not found"):
             load_markdown_with_frontmatter("non_existent_file.md")
-        except FileNotFoundError as e:
-            assert "Markdown file not found" in str(e)
 
-    def test_parse_invalid_markdown(self, tmp_path: Path):
-        invalid_md_content = """---
-provider: openai
-model gpt-4
-tools:  - tools.file_ops
-  - tools.bash
----
-This is invalid markdown frontmatter.
-"""
-        md_file = tmp_path / "invalid_agent.md"
-        md_file.write_text(invalid_md_content, encoding="utf-8")
-        try:
+    @pytest.mark.parametrize(
+        "md_file", [INVALID_MD_CONTENT, UNCLOSED_FLOW_MD_CONTENT], indirect=True, ids=["invalid", "unclosed_flow"]
+    )
+    def test_parse_invalid_markdown(self, md_file: Path):
+        with pytest.raises(ValueError, match="Failed to parse markdown frontmatter"):
             load_markdown_with_frontmatter(str(md_file))
-        except ValueError as e:
-            assert "Failed to parse markdown frontmatter" in str(e)
+
+    def test_reparse_after_file_change(self, tmp_path: Path):
+        md_file = tmp_path / "agent.md"
+        md_file.write_bytes(b"---\nmodel: gpt-4\n---\nFirst")
+        metadata, content = load_markdown_with_frontmatter(str(md_file))
+        metadata["model"] = "mutated"
+
+        metadata, content = load_markdown_with_frontmatter(str(md_file))
+        assert metadata["model"] == "gpt-4"
+        assert content == "First"
+
+        md_file.write_bytes(b"---\nmodel: gpt-4.1\n---\nSecond version")
+        metadata, content = load_markdown_with_frontmatter(str(md_file))
+        assert metadata["model"] == "gpt-4.1"
+        assert content == "Second version"
+
+    def test_relative_path_follows_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        first, second = tmp_path / "first", tmp_path / "second"
+        for directory, model in ((first, "gpt-a"), (second, "gpt-b")):
+            directory.mkdir()
+            md_file = directory / "agent.md"
+            md_file.write_bytes(f"---\nmodel: {model}\n---\nBody".encode())
+            # Same size and mtime, so only the file identity tells them apart
+            os.utime(md_file, ns=(0, 0))
+
+        monkeypatch.chdir(first)
+        assert load_markdown_with_frontmatter("agent.md")[0]["model"] == "gpt-a"
+        monkeypatch.chdir(second)
+        assert load_markdown_with_frontmatter("agent.md")[0]["model"] == "gpt-b"
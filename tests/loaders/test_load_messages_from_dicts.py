@@ -1,24 +1,31 @@
 """Tests for load_messages_from_dicts."""
 
 # third party
+import pytest
 
 # local
 from vindao_agents.loaders.load_messages_from_dicts import load_messages_from_dicts
 from vindao_agents.models.messages import AssistantMessage, SystemMessage, ToolMessage, UserMessage
 
+TOOL_CALL_DICT = {"name": "test_tool", "call": "test_call", "result": "test_result"}
+MESSAGE_DICTS = [
+    {"role": "system", "content": "System message"},
+    {"role": "user", "content": "User message"},
+    {"role": "assistant", "content": "Assistant message"},
+    {"role": "tool", "content": "Tool message", "name": "test_tool", "tool_call": TOOL_CALL_DICT},
+]
+
 
 class TestLoadMessagesFromDicts:
+    @pytest.mark.parametrize(
+        "payload,expected_cls",
+        list(zip(MESSAGE_DICTS, [SystemMessage, UserMessage, AssistantMessage, ToolMessage], strict=True)),
+        ids=[payload["role"] for payload in MESSAGE_DICTS],
+    )
+    def test_load_message_by_role(self, payload, expected_cls):
+        message = load_messages_from_dicts([payload])[0]
+        assert isinstance(message, expected_cls)
+
     def test_load_messages_from_dicts(self):
-        tool_call_dict = {"name": "test_tool", "call": "test_call", "result": "test_result"}
-        dicts = [
-            {"role": "system", "content": "System message"},
-            {"role": "user", "content": "User message"},
-            {"role": "assistant", "content": "Assistant message"},
-            {"role": "tool", "content": "Tool message", "name": "test_tool", "tool_call": tool_call_dict},
-        ]
-        messages = load_messages_from_dicts(dicts)
-        assert len(messages) == 4
-        assert isinstance(messages[0], SystemMessage)
-        assert isinstance(messages[1], UserMessage)
-        assert isinstance(messages[2], AssistantMessage)
-        assert isinstance(messages[3], ToolMessage)
+        messages = load_messages_from_dicts(MESSAGE_DICTS)
+        assert [type(message) for message in messages] == [SystemMessage, UserMessage, AssistantMessage, ToolMessage]
@@ -7,10 +7,13 @@ from vindao_agents.loaders.load_public_functions_from_identifier import load_pub
 
 
 class TestLoadPublicFunctions:
-    def test_load_functions(self):
-        # Assuming there's a module named 'sample_module' with public functions
-        functions = load_public_functions_from_identifier("vindao_agents.formatters.format_exception")
-        function_names = [name for name, _ in functions]
+    def test_load_functions(self, format_exception_publics):
+        function_names = [name for name, _ in format_exception_publics]
         assert "format_exception" in function_names
         assert "TestFormatException" not in function_names
-        assert len(functions) == 1  # Only one public function expected
+        assert len(format_exception_publics) == 1  # Only one public function expected
+
+    def test_load_functions_reexported_by_package(self):
+        functions = load_public_functions_from_identifier("tools.file_ops")
+        function_names = [name for name, _ in functions]
+        assert function_names == ["list_dir", "read_file", "read_files", "write_file"]
@@ -4,35 +4,47 @@
 from pathlib import Path
 
 # third party
+import pytest
+
 # local
 from vindao_agents.loaders.load_system_message_template import load_system_message_template
 
+DEFAULT_PROMPT = b"This is the default system message."
+GPT4_PROMPT = b"This is the GPT-4 system message."
 
-class TestLoadSystemMessageTemplate:
-    def test_load_default_template(self, tmp_path: Path):
-        user_data_dir = tmp_path / "vindao_agents"
-        prompts_dir = user_data_dir / "prompts" / "system_message"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
 
+class TestLoadSystemMessageTemplate:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def prompts_dir(cls, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Create the user data prompts layout once for the tests in this class."""
+        prompts_dir = tmp_path_factory.mktemp("vindao_agents") / "prompts" / "system_message"
+        prompts_dir.mkdir(parents=True)
+        return prompts_dir
+
+    @pytest.fixture
+    def user_data_dir(self, prompts_dir: Path) -> Path:
+        return prompts_dir.parent.parent
+
+    @pytest.fixture(autouse=True)
+    def _clear_prompts(self, prompts_dir: Path):
+        """Remove prompt files written by a test so each test starts from an empty directory."""
+        yield
+        for prompt_file in prompts_dir.iterdir():
+            prompt_file.unlink()
+
+    def test_load_default_template(self, prompts_dir: Path, user_data_dir: Path):
         # Create a default prompt file
-        default_prompt_path = prompts_dir / "default.prompt"
-        default_content = "This is the default system message."
-        default_prompt_path.write_text(default_content, encoding="utf-8")
+        (prompts_dir / "default.prompt").write_bytes(DEFAULT_PROMPT)
 
         # Load the template for a non-existing model
         loaded_template = load_system_message_template("non_existing_model", user_data_dir)
-        assert loaded_template == default_content
-
-    def test_load_model_specific_template(self, tmp_path: Path):
-        user_data_dir = tmp_path / "vindao_agents"
-        prompts_dir = user_data_dir / "prompts" / "system_message"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
+        assert loaded_template == DEFAULT_PROMPT.decode()
 
+    def test_load_model_specific_template(self, prompts_dir: Path, user_data_dir: Path):
         # Create a model-specific prompt file
-        model_prompt_path = prompts_dir / "gpt-4.prompt"
-        model_content = "This is the GPT-4 system message."
-        model_prompt_path.write_text(model_content, encoding="utf-8")
+        (prompts_dir / "gpt-4.prompt").write_bytes(GPT4_PROMPT)
 
         # Load the template for the existing model
         loaded_template = load_system_message_template("gpt-4", user_data_dir)
-        assert loaded_template == model_content
+        assert loaded_template == GPT4_PROMPT.decode()
@@ -84,3 +84,13 @@ class TestParseDocstringFromFile:
 
         result = parse_docstring_from_file(file_path)
         assert result == "Single quoted docstring."
+
+    def test_reparse_after_file_change(self, tmp_path: Path):
+        """Test that a cached docstring is refreshed once the file changes."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text('"""First."""')
+        assert parse_docstring_from_file(file_path) == "First."
+        assert parse_docstring_from_file(file_path) == "First."
+
+        file_path.write_text('"""Second version."""')
+        assert parse_docstring_from_file(file_path) == "Second version."
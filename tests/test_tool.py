@@ -1,7 +1,9 @@
 """Tests for Tool class."""
 
 # stdlib
+import gc
 import inspect
+import weakref
 
 # third party
 # local
@@ -28,6 +30,9 @@ class TestTool:
         tool = Tool(sample_tool)
         result = tool(2, 3)
         assert result == "5"
+        # Invoking a tool never needs its source or signature
+        assert "source" not in vars(tool)
+        assert "signature" not in vars(tool)
 
     def test_tool_invocation_exception(self):
         def faulty_tool(x: int, y: int) -> int:
@@ -36,3 +41,29 @@ class TestTool:
         tool = Tool(faulty_tool)
         result = tool(2, 0)
         assert "ZeroDivisionError" in result
+
+    def test_source_cache_does_not_keep_function_alive(self):
+        def sample_tool(x: int) -> int:
+            """Returns x."""
+            return x
+
+        assert Tool(sample_tool).source == inspect.getsource(sample_tool)
+        ref = weakref.ref(sample_tool)
+        del sample_tool
+        gc.collect()
+
+        assert ref() is None
+
+    def test_to_instruction_is_memoized_per_flag(self):
+        def sample_tool(x: int) -> int:
+            """Returns x."""
+            return x
+
+        tool = Tool(sample_tool)
+        with_source = tool.to_instruction(include_source=True)
+        without_source = tool.to_instruction(include_source=False)
+
+        assert with_source == tool.source + "\n\n"
+        assert without_source.startswith("def sample_tool(x: int) -> int")
+        assert tool.to_instruction(include_source=True) is with_source
+        assert tool.to_instruction(include_source=False) is without_source
@@ -4,43 +4,59 @@
 from pathlib import Path
 
 # third party
+import pytest
+
 # local
 from vindao_agents.tools.file_ops.list_dir import list_dir
 
 
+@pytest.fixture(scope="session")
+def list_dir_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a non-package directory holding every entry kind the read-only tests look for."""
+    # list_dir never modifies what it lists, so one tree is shared instead of copied per test
+    root = tmp_path_factory.mktemp("list_dir_tree")
+    (root / "visible_file.txt").write_text("visible")
+    (root / ".hidden_file.txt").write_text("hidden")
+    (root / ".gitignore").write_text("*.pyc")
+    (root / "data.txt").write_text("some data")
+    (root / "__pycache__").mkdir()
+    (root / "normal_dir").mkdir()
+    (root / "docs").mkdir()
+    (root / "subdir").mkdir()
+    (root / "sample_module.py").write_text('"""This is a sample module."""\n\nx = 42')
+    (root / "module.py").write_text('"""A module."""\n\nx = 42')
+    (root / "script.py").write_text('"""Script file."""\n\nprint("hello")')
+    (root / "subpkg").mkdir()
+    (root / "subpkg" / "__init__.py").write_text('"""Subpackage docstring."""')
+    (root / "package").mkdir()
+    (root / "package" / "__init__.py").write_text('"""A package."""')
+    return root
+
+
+def list_entries(root: Path, **kwargs) -> set[str]:
+    """Run list_dir once and return its entry lines relative to root, for O(1) membership checks."""
+    prefix = root.as_posix() + "/"
+    return {line.removeprefix(prefix) for line in list_dir(root.as_posix(), **kwargs).splitlines()}
+
+
 class TestListDir:
     """Tests for list_dir function."""
 
-    def test_ignore_and_hidden(self, tmp_path: Path):
+    def test_ignore_and_hidden(self, list_dir_tree: Path):
         """Test filtering of hidden files and ignored directories."""
-        # Setup
-        (tmp_path / "visible_file.txt").write_text("visible")
-        (tmp_path / ".hidden_file.txt").write_text("hidden")
-        (tmp_path / "__pycache__").mkdir()
-        (tmp_path / "normal_dir").mkdir()
-
         # Test without hidden files
-        output = list_dir(tmp_path.as_posix(), show_hidden=False)
-        assert "visible_file.txt" in output
-        assert ".hidden_file.txt" not in output
-        assert "__pycache__" not in output
-        assert "normal_dir/" in output
+        entries = list_entries(list_dir_tree, show_hidden=False)
+        assert {"visible_file.txt", "normal_dir/"} <= entries
+        assert not any(name in entry for entry in entries for name in (".hidden_file.txt", "__pycache__"))
 
         # Test with hidden files
-        output = list_dir(tmp_path.as_posix(), show_hidden=True)
-        assert "visible_file.txt" in output
-        assert ".hidden_file.txt" in output
-        assert "__pycache__" not in output
-        assert "normal_dir/" in output
+        entries = list_entries(list_dir_tree, show_hidden=True)
+        assert {"visible_file.txt", ".hidden_file.txt", "normal_dir/"} <= entries
+        assert not any("__pycache__" in entry for entry in entries)
 
-    def test_python_module_with_docstring(self, tmp_path: Path):
+    def test_python_module_with_docstring(self, list_dir_tree: Path):
         """Test that Python module docstrings are displayed."""
-        # Setup
-        module_path = tmp_path / "sample_module.py"
-        module_path.write_text('"""This is a sample module."""\n\nx = 42')
-
-        # Test
-        output = list_dir(tmp_path.as_posix())
+        output = list_dir(list_dir_tree.as_posix())
         assert "sample_module.py - This is a sample module." in output
 
     def test_python_module_without_docstring(self, tmp_path: Path):
@@ -70,16 +86,9 @@ class TestListDir:
         # Module should be listed with its docstring
         assert any("module.py - A module." in line for line in lines)
 
-    def test_nested_package_with_docstring(self, tmp_path: Path):
+    def test_nested_package_with_docstring(self, list_dir_tree: Path):
         """Test that nested packages show their docstrings."""
-        # Setup
-        subpackage = tmp_path / "subpkg"
-        subpackage.mkdir()
-        (subpackage / "__init__.py").write_text('"""Subpackage docstring."""')
-        (tmp_path / "file.txt").write_text("content")
-
-        # Test
-        output = list_dir(tmp_path.as_posix())
+        output = list_dir(list_dir_tree.as_posix())
         assert "subpkg/ - Subpackage docstring." in output
 
     def test_custom_ignore_list(self, tmp_path: Path):
@@ -90,10 +99,8 @@ class TestListDir:
         (tmp_path / "file.txt").write_text("content")
 
         # Test with custom ignore list
-        output = list_dir(tmp_path.as_posix(), ignore=["ignore_this"])
-        assert "keep_this/" in output
-        assert "ignore_this" not in output
-        assert "file.txt" in output
+        entries = list_entries(tmp_path, ignore=["ignore_this"])
+        assert entries == {"keep_this/", "file.txt"}
 
     def test_empty_directory(self, tmp_path: Path):
         """Test listing an empty directory."""
@@ -105,36 +112,17 @@ class TestListDir:
         output = list_dir(empty_dir.as_posix())
         assert output == ""
 
-    def test_directory_without_package(self, tmp_path: Path):
+    def test_directory_without_package(self, list_dir_tree: Path):
         """Test that directories without __init__.py don't show package info."""
-        # Setup - just regular directory
-        (tmp_path / "module.py").write_text('"""A module."""\n\nx = 42')
-        (tmp_path / "subdir").mkdir()
-
-        # Test
-        output = list_dir(tmp_path.as_posix())
+        output = list_dir(list_dir_tree.as_posix())
 
         # Should not have "Package:" at the top
         assert not output.startswith("Package:")
         assert "module.py - A module." in output
         assert "subdir/" in output
 
-    def test_mixed_content(self, tmp_path: Path):
+    def test_mixed_content(self, list_dir_tree: Path):
         """Test directory with mixed content types."""
-        # Setup
-        (tmp_path / "script.py").write_text('"""Script file."""\n\nprint("hello")')
-        (tmp_path / "data.txt").write_text("some data")
-        (tmp_path / "docs").mkdir()
-        (tmp_path / ".gitignore").write_text("*.pyc")
-
-        pkg = tmp_path / "package"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('"""A package."""')
-
-        # Test without hidden files
-        output = list_dir(tmp_path.as_posix(), show_hidden=False)
-        assert "script.py - Script file." in output
-        assert "data.txt" in output
-        assert "docs/" in output
-        assert ".gitignore" not in output  # Hidden file excluded
-        assert "package/ - A package." in output
+        entries = list_entries(list_dir_tree, show_hidden=False)
+        assert {"script.py - Script file.", "data.txt", "docs/", "package/ - A package."} <= entries
+        assert not any(".gitignore" in entry for entry in entries)  # Hidden file excluded
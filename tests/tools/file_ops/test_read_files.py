@@ -8,6 +8,7 @@ import pytest
 # local
 from vindao_agents.tools.file_ops.read_file import read_file
 from vindao_agents.tools.file_ops.read_files import read_files
+from vindao_agents.tools.file_ops.write_file import write_file
 
 
 class TestReadFile:
@@ -19,6 +20,13 @@ class TestReadFile:
         result = read_file(str(test_file))
         assert result == "Hello, World!"
 
+    def test_read_file_round_trips_write_file(self, tmp_path):
+        """Test that read_file returns exactly what write_file wrote, including non-ASCII and CRLF."""
+        test_file = tmp_path / "test.txt"
+        write_file(str(test_file), "h\u00e9llo\r\nw\u00f6rld")
+
+        assert read_file(str(test_file)) == "h\u00e9llo\r\nw\u00f6rld"
+
     def test_read_nonexistent_file_raises_error(self):
         """Test that reading a nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -236,3 +236,21 @@ class TestResolvePathWithFallbacks:
         """Test behavior with empty directories list."""
         with pytest.raises(FileNotFoundError):
             resolve_path_with_fallbacks(["test.txt"], [])
+
+    def test_repeat_lookup_sees_new_and_removed_files(self, tmp_path: Path):
+        """Test that repeat lookups re-probe the filesystem and see files appear or disappear."""
+        dir1 = tmp_path / "dir1"
+        dir2 = tmp_path / "dir2"
+        dir1.mkdir()
+        dir2.mkdir()
+        (dir2 / "default.txt").write_text("default")
+
+        assert resolve_path_with_fallbacks(["model.txt", "default.txt"], [dir1, dir2]) == dir2 / "default.txt"
+
+        (dir1 / "model.txt").write_text("model")
+        assert resolve_path_with_fallbacks(["model.txt", "default.txt"], [dir1, dir2]) == dir1 / "model.txt"
+
+        (dir1 / "model.txt").unlink()
+        (dir2 / "default.txt").unlink()
+        with pytest.raises(FileNotFoundError):
+            resolve_path_with_fallbacks(["model.txt", "default.txt"], [dir1, dir2])